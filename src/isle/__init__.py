@@ -49,6 +49,8 @@ class _LatticeHandle:
             getLogger(__name__).error("Lattice files are not installed as part of Isle. "
                                       "Check your installation.")
             raise RuntimeError("Lattice files are not installed as part of Isle.")
+        ## Maps names of lattices that have already been loaded to Lattice objects.
+        self._cache = {}
 
     def keys(self):
         """!Return a list of the names of all built in lattices."""
@@ -57,15 +59,18 @@ class _LatticeHandle:
 
     def __getitem__(self, name):
         """!Load and return a built in lattice."""
-        try:
-            with self.pkgr.resource_stream(__name__, self._fname(name)) as latfile:
-                return fileio.yaml.loadLattice(latfile)
-        except FileNotFoundError:
-            getLogger(__name__).error("Unknown lattice: '%s' Installed lattices:\n %s\n"
-                                      "Use isle.LATTICES.loadExternal(fname) to load "
-                                      "from a custom file.",
-                                      name, self.keys())
-            raise ValueError(f"Unknown lattice: {name}") from None
+        if name not in self._cache:
+            try:
+                with self.pkgr.resource_stream(__name__, self._fname(name)) as latfile:
+                    self._cache[name] = fileio.yaml.loadLattice(latfile)
+            except FileNotFoundError:
+                getLogger(__name__).error("Unknown lattice: '%s' Installed lattices:\n %s\n"
+                                          "Use isle.LATTICES.loadExternal(fname) to load "
+                                          "from a custom file.",
+                                          name, self.keys())
+                raise ValueError(f"Unknown lattice: {name}") from None
+        # Lattices are mutable (e.g. through nt()), so never hand out the cached object.
+        return Lattice(self._cache[name])
 
     def loadExternal(self, fname):
         """!Load and return a lattice from an external file."""
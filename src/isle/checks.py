@@ -22,12 +22,20 @@ class ConsistencyCheckFailure(Exception):
     Indicate failure of a consistency check during HMC.
     """
 
+def _isNotReal(vec, tol=1e-15):
+    r"""!
+    Check whether the ratio of imaginary and real parts of `vec` exceeds `tol`.
+    Converts `vec` to an array only once and works on views of its real and imaginary parts.
+    """
+    arr = np.array(vec, copy=False)
+    return np.max(arr.imag / arr.real) > tol
+
 def realityCheck(startPhi, startPi, startEnergy, endPhi, endPi, endEnergy):
     r"""!
     \ingroup check
     Check whether endPhi and endPi are real.
     """
-    if np.max(np.imag(endPhi)/np.real(endPhi)) > 1e-15:
+    if _isNotReal(endPhi):
         raise ConsistencyCheckFailure("phi is not real")
-    if np.max(np.imag(endPi)/np.real(endPi)) > 1e-15:
+    if _isNotReal(endPi):
         raise ConsistencyCheckFailure("pi is not real")
@@ -16,9 +16,7 @@ from scipy.optimize import curve_fit
 
 from .evolver import Evolver
 from .selector import BinarySelector
-from .leapfrog import ConstStepLeapfrog
-from .transform import backwardTransform, forwardTransform
-from .. import Vector, leapfrog
+from .leapfrog import ConstStepLeapfrog, evolveLeapfrog
 from ..collection import extendListInDict
 from ..h5io import createH5Group, loadList
 
@@ -773,32 +771,14 @@ class LeapfrogTuner(Evolver):  # pylint: disable=too-many-instance-attributes
         """
 
         params = self.currentParams()
-
-        # get start phi for MD integration
-        phiMD, logdetJ = backwardTransform(self.transform, stage)
-        if self.transform is not None and "logdetJ" not in stage.logWeights:
-            stage.logWeights["logdetJ"] = logdetJ
-
-        # do MD integration
-        pi = Vector(self.rng.normal(0, 1, len(stage.phi))+0j)
-        phiMD1, pi1, actValMD1 = leapfrog(phiMD, pi, self.action,
-                                          params["length"], params["nstep"])
-
-        # transform to MC manifold
-        phi1, actVal1, logdetJ1 = forwardTransform(self.transform, phiMD1, actValMD1)
-
-        # accept/reject on MC manifold
-        energy0 = stage.sumLogWeights()+np.linalg.norm(pi)**2/2
-        energy1 = actVal1+logdetJ1+np.linalg.norm(pi1)**2/2
-        trajPoint1 = self._selector.selectTrajPoint(energy0, energy1)
+        stage, trajPoint1, energy0, energy1 = evolveLeapfrog(stage, self.action,
+                                                             params["length"], params["nstep"],
+                                                             self.rng, self._selector,
+                                                             self.transform)
 
         self.registrar.currentRecord().add(min(1, exp(np.real(energy0 - energy1))),
                                            trajPoint1)
-
-        logWeights = None if self.transform is None \
-            else {"logdetJ": (logdetJ, logdetJ1)[trajPoint1]}
-        return stage.accept(phi1, actVal1, logWeights) if trajPoint1 == 1 \
-            else stage.reject()
+        return stage
 
     def _shiftNstep(self):
         r"""!
@@ -1314,32 +1294,14 @@ class LeapfrogTunerLength(Evolver):  # pylint: disable=too-many-instance-attribu
         """
 
         params = self.currentParams()
-
-        # get start phi for MD integration
-        phiMD, logdetJ = backwardTransform(self.transform, stage)
-        if self.transform is not None and "logdetJ" not in stage.logWeights:
-            stage.logWeights["logdetJ"] = logdetJ
-
-        # do MD integration
-        pi = Vector(self.rng.normal(0, 1, len(stage.phi))+0j)
-        phiMD1, pi1, actValMD1 = leapfrog(phiMD, pi, self.action,
-                                          params["length"], params["nstep"])
-
-        # transform to MC manifold
-        phi1, actVal1, logdetJ1 = forwardTransform(self.transform, phiMD1, actValMD1)
-
-        # accept/reject on MC manifold
-        energy0 = stage.sumLogWeights()+np.linalg.norm(pi)**2/2
-        energy1 = actVal1+logdetJ1+np.linalg.norm(pi1)**2/2
-        trajPoint1 = self._selector.selectTrajPoint(energy0, energy1)
+        stage, trajPoint1, energy0, energy1 = evolveLeapfrog(stage, self.action,
+                                                             params["length"], params["nstep"],
+                                                             self.rng, self._selector,
+                                                             self.transform)
 
         self.registrar.currentRecord().add(min(1, exp(np.real(energy0 - energy1))),
                                            trajPoint1)
-
-        logWeights = None if self.transform is None \
-            else {"logdetJ": (logdetJ, logdetJ1)[trajPoint1]}
-        return stage.accept(phi1, actVal1, logWeights) if trajPoint1 == 1 \
-            else stage.reject()
+        return stage
 
     def _shiftLength(self):
         r"""!
@@ -54,9 +54,9 @@ class TwoPiJumps(Evolver):
 
         phi = stage.phi
         actVal = stage.actVal
-        accepted = []
+        accepted = np.zeros(self.nBatches, dtype=int)
 
-        for _ in range(self.nBatches):
+        for batch in range(self.nBatches):
             # lattice sites at which to jump
             sites = self.rng.choice(self.latSize, self.batchSize, replace=False)
             # shifts for the above sites
@@ -70,12 +70,10 @@ class TwoPiJumps(Evolver):
             if self.selector.selectTrajPoint(actVal, newActVal) == 1:
                 phi = newPhi
                 actVal = newActVal
-                accepted.append(1)
-            else:
-                accepted.append(0)
+                accepted[batch] = 1
 
         self.acceptedPerBatch.append(accepted)
-        if any(accepted):
+        if accepted.any():
             return stage.accept(isle.Vector(newPhi), newActVal)
         return stage.reject()
 
@@ -42,28 +42,10 @@ class ConstStepLeapfrog(Evolver):
         \returns EvolutionStage at the end of this evolution step.
         """
 
-        # get start phi for MD integration
-        phiMD, logdetJ = backwardTransform(self.transform, stage)
-        if self.transform is not None and "logdetJ" not in stage.logWeights:
-            stage.logWeights["logdetJ"] = logdetJ
-
-        # do MD integration
-        pi = Vector(self.rng.normal(0, 1, len(stage.phi))+0j)
-        phiMD1, pi1, actValMD1 = leapfrog(phiMD, pi, self.action, self.length, self.nstep)
-
-        # transform to MC manifold
-        phi1, actVal1, logdetJ1 = forwardTransform(self.transform, phiMD1, actValMD1)
-
-        # accept/reject on MC manifold
-        energy0 = stage.sumLogWeights()+np.linalg.norm(pi)**2/2
-        energy1 = actVal1+logdetJ1+np.linalg.norm(pi1)**2/2
-        trajPoint = self.selector.selectTrajPoint(energy0, energy1)
+        stage, trajPoint, _, _ = evolveLeapfrog(stage, self.action, self.length, self.nstep,
+                                                self.rng, self.selector, self.transform)
         self.trajPoints.append(trajPoint)
-
-        logWeights = None if self.transform is None \
-            else {"logdetJ": (logdetJ, logdetJ1)[trajPoint]}
-        return stage.accept(phi1, actVal1, logWeights) if trajPoint == 1 \
-            else stage.reject()
+        return stage
 
     def save(self, h5group, manager):
         r"""!
@@ -156,29 +138,11 @@ class LinearStepLeapfrog(Evolver):
         """
         self._current += 1
 
-        # get start phi for MD integration
-        phiMD, logdetJ = backwardTransform(self.transform, stage)
-        if self.transform is not None and "logdetJ" not in stage.logWeights:
-            stage.logWeights["logdetJ"] = logdetJ
-
-        # do MD integration
-        pi = Vector(self.rng.normal(0, 1, len(stage.phi))+0j)
-        phiMD1, pi1, actValMD1 = leapfrog(phiMD, pi, self.action,
-                                          next(self._lengthIter), int(next(self._nstepIter)))
-
-        # transform to MC manifold
-        phi1, actVal1, logdetJ1 = forwardTransform(self.transform, phiMD1, actValMD1)
-
-        # accept/reject on MC manifold
-        energy0 = stage.sumLogWeights()+np.linalg.norm(pi)**2/2
-        energy1 = actVal1+logdetJ1+np.linalg.norm(pi1)**2/2
-        trajPoint = self.selector.selectTrajPoint(energy0, energy1)
+        stage, trajPoint, _, _ = evolveLeapfrog(stage, self.action,
+                                                next(self._lengthIter), int(next(self._nstepIter)),
+                                                self.rng, self.selector, self.transform)
         self.trajPoints.append(trajPoint)
-
-        logWeights = None if self.transform is None \
-            else {"logdetJ": (logdetJ, logdetJ1)[trajPoint]}
-        return stage.accept(phi1, actVal1, logWeights) if trajPoint == 1 \
-            else stage.reject()
+        return stage
 
     def save(self, h5group, manager):
         r"""!
@@ -226,3 +190,47 @@ class LinearStepLeapfrog(Evolver):
         return f"""<LinearStepLeapfrog> (0x{id(self):x})
   lengthRange = {self.lengthRange}, nstepRange = {self.nstepRange}, ninterp = {self.ninterp}
   acceptance rate = {np.mean(self.trajPoints)}"""
+
+
+def evolveLeapfrog(stage, action, length, nstep, rng, selector, transform=None):
+    r"""! \ingroup evolvers
+    Run the leapfrog integrator and select a trajectory point with Metropolis accept/reject.
+    Shared implementation of the leapfrog evolvers and tuners.
+    \param stage EvolutionStage at the beginning of this evolution step.
+    \param action Instance of isle.Action to use for molecular dynamics.
+    \param length Length of the MD trajectory.
+    \param nstep Number of MD steps.
+    \param rng Random number generator used to draw momenta.
+    \param selector BinarySelector used for accept/reject.
+    \param transform (Instance of isle.evolver.transform.Transform)
+                     Used this to transform a configuration after MD integration
+                     but before Metropolis accept/reject.
+    \returns Tuple of
+             - EvolutionStage at the end of this evolution step.
+             - The selected trajectory point.
+             - Energy at the start of the trajectory.
+             - Energy at the end of the trajectory.
+    """
+
+    # get start phi for MD integration
+    phiMD, logdetJ = backwardTransform(transform, stage)
+    if transform is not None and "logdetJ" not in stage.logWeights:
+        stage.logWeights["logdetJ"] = logdetJ
+
+    # do MD integration
+    pi = Vector(rng.normal(0, 1, len(stage.phi))+0j)
+    phiMD1, pi1, actValMD1 = leapfrog(phiMD, pi, action, length, nstep)
+
+    # transform to MC manifold
+    phi1, actVal1, logdetJ1 = forwardTransform(transform, phiMD1, actValMD1)
+
+    # accept/reject on MC manifold
+    energy0 = stage.sumLogWeights()+np.vdot(pi, pi).real/2
+    energy1 = actVal1+logdetJ1+np.vdot(pi1, pi1).real/2
+    trajPoint = selector.selectTrajPoint(energy0, energy1)
+
+    logWeights = None if transform is None \
+        else {"logdetJ": (logdetJ, logdetJ1)[trajPoint]}
+    newStage = stage.accept(phi1, actVal1, logWeights) if trajPoint == 1 \
+        else stage.reject()
+    return newStage, trajPoint, energy0, energy1
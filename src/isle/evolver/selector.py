@@ -3,7 +3,7 @@ r"""!\file
 Selectors to pick proposed trajectories (accept/reject).
 """
 
-import numpy as np
+from math import exp
 
 
 class BinarySelector:
@@ -25,8 +25,9 @@ class BinarySelector:
         \return `0` if `energy0` was selected, `1` otherwise.
         """
 
-        deltaE = np.real(energy1 - energy0)
-        return 1 if deltaE < 0 or np.exp(-deltaE) > self.rng.uniform(0, 1) \
+        # Energies are scalars, stay with Python floats to avoid NumPy's dispatch overhead.
+        deltaE = float((energy1 - energy0).real)
+        return 1 if deltaE < 0 or exp(-deltaE) > self.rng.uniform(0, 1) \
             else 0
 
     def selectTrajectory(self, energy0, data0, energy1, data1):
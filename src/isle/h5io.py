@@ -249,7 +249,8 @@ def loadActionValuesFrom(h5obj, full=False, base="/"):
 
     if action is None and "configuration" in grp:
         indices, groups = zip(*loadList(grp["configuration"]))
-        action = np.array([grp["actVal"][()] for grp in groups])
+        action = np.fromiter((cfgGrp["actVal"][()] for cfgGrp in groups),
+                             dtype=complex, count=len(groups))
         cRange = listToSlice(indices)
 
     if action is None:
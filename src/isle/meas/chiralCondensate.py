@@ -39,7 +39,9 @@ class ChiralCondensate(Measurement):
         # Normalize by spacetime volume
         res = np.array(isle.solveM(self.hfm, stage.phi, self.species, rhss), copy=False) / (nx*nt)
 
-        self.nextItem("chiCon")[...] = np.mean([np.dot(rhs, r) for rhs, r in zip(rhss, res)])
+        # Average of rhs_i . res_i over all samples in a single contraction.
+        self.nextItem("chiCon")[...] = np.einsum("ij,ij->", np.array(rhss, copy=False), res) \
+            / self.nsamples
 
     def _getRHSs(self, nt):
         """!
@@ -50,6 +52,6 @@ class ChiralCondensate(Measurement):
 
         if self._rhss is None or self._rhss.rows() != nt*self.hfm.nx():
             # Create a large set of sources:
-            self._rhss = isle.Matrix(np.array([isle.Vector(self.rng.normal(0, 1, nt*self.hfm.nx())+0j)
-                                               for _ in range(self.nsamples)]))
+            # One draw for all samples gives the same random numbers as drawing them row by row.
+            self._rhss = isle.Matrix(self.rng.normal(0, 1, (self.nsamples, nt*self.hfm.nx()))+0j)
         return self._rhss
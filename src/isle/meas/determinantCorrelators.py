@@ -64,6 +64,7 @@ class DeterminantCorrelators(Measurement):
         self._time_slowest = "xfyi->fixy"
         self._time_averaging = "idf,fi->d"
         self._roll = None
+        self._bosonicRoll = None
 
     def __call__(self, stage, itr):
         """!Record the determinant correlators."""
@@ -79,18 +80,19 @@ class DeterminantCorrelators(Measurement):
                "PH": np.zeros(H.shape[0:2], dtype=complex)}
 
         nt = det["P"].shape[0]
-        time = np.arange(nt)
 
-        for f in time:
-            for i in time:
+        for f in range(nt):
+            for i in range(nt):
                 det["P"][f,i] = np.linalg.det(P[f,i])
                 det["H"][f,i] = np.linalg.det(H[f,i])
                 det["PH"][f,i] = det["P"][f,i]*det["H"][f,i]
 
-        self._roll = np.array([temporalRoller(nt, -t, fermionic=self.fermionic) for t in range(nt)])
-        np.einsum(self._time_averaging, self._roll/nt, det["P"], out=self.nextItem("P"))
-        np.einsum(self._time_averaging, self._roll/nt, det["H"], out=self.nextItem("H"))
+        # The rollers only depend on nt, build them (including the normalization) once.
+        if self._roll is None:
+            self._roll = np.array([temporalRoller(nt, -t, fermionic=self.fermionic) for t in range(nt)]) / nt
+            # If we fully populate particles AND holes the operator is necessarily bosonic.
+            self._bosonicRoll = np.array([temporalRoller(nt, -t, fermionic=False) for t in range(nt)]) / nt
 
-        # If we fully populate particles AND holes the operator is necessarily bosonic.
-        self._roll = np.array([temporalRoller(nt, -t, fermionic=False) for t in range(nt)])
-        np.einsum(self._time_averaging, self._roll/nt, det["PH"], out=self.nextItem("PH"))
+        np.einsum(self._time_averaging, self._roll, det["P"], out=self.nextItem("P"))
+        np.einsum(self._time_averaging, self._roll, det["H"], out=self.nextItem("H"))
+        np.einsum(self._time_averaging, self._bosonicRoll, det["PH"], out=self.nextItem("PH"))
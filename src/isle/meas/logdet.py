@@ -35,9 +35,11 @@ class Logdet(Measurement):
                                                        isle.Species.HOLE)
         else:
             # use dense, slow numpy routine to get stable result
-            ld = np.linalg.slogdet(isle.Matrix(self.hfm.M(-1j*stage.phi, isle.Species.PARTICLE)))
+            # the rotated field is shared between both species
+            phi = -1j*stage.phi
+            ld = np.linalg.slogdet(isle.Matrix(self.hfm.M(phi, isle.Species.PARTICLE)))
             self.nextItem("particles")[...] = np.log(ld[0]) + ld[1]
-            ld = np.linalg.slogdet(isle.Matrix(self.hfm.M(-1j*stage.phi, isle.Species.HOLE)))
+            ld = np.linalg.slogdet(isle.Matrix(self.hfm.M(phi, isle.Species.HOLE)))
             self.nextItem("holes")[...] = np.log(ld[0]) + ld[1]
 
     def setup(self, memoryAllowance, expectedNConfigs, file, maxBufferSize=None):
@@ -36,15 +36,21 @@ We can transform into a different basis; by default the results are in the spati
 """
 
 
-from logging import getLogger
-
 import numpy as np
 import h5py as h5
 from pentinsula.h5utils import open_or_pass_file
 
 from .measurement import Measurement, BufferSpec
 
-#TODO: save / retrieve einsum paths.
+def _propagatorDiagonal(allToAll, stage, itr):
+    r"""!
+    Return the spacetime diagonal P[x,t,x,t] of an all-to-all propagator.
+    Uses `allToAll.diagonal` if it exists and extracts the diagonal from
+    the full propagator otherwise.
+    """
+    if hasattr(allToAll, "diagonal"):
+        return allToAll.diagonal(stage, itr)
+    return np.einsum("xtxt->xt", allToAll(stage, itr))
 
 class OnePointFunctions(Measurement):
     r"""!
@@ -79,47 +85,20 @@ class OnePointFunctions(Measurement):
 
         self.transform = transform
 
-        self._einsum_path = None
-
     def __call__(self, stage, itr):
-        """!Record the spin-spin correlators."""
-
-        P = self.particle(stage, itr)
-        H = self.hole(stage, itr)
-
-        nx = P.shape[0]
-        nt = P.shape[1]
-
-        d = np.eye(nx*nt).reshape(*P.shape) # A Kronecker delta
-
-        log = getLogger(__name__)
-
-        data={}
-        data["np"] = d-P
-        data["nh"] = d-H
+        """!Record the one-point functions."""
 
-        if self._einsum_path is None:
+        # Only the diagonal P[x,t,x,t] enters via <1 - P_xx>.
+        # The transformation is a plain matrix-vector product and written
+        # straight into the result buffer.
+        for name, allToAll in (("np", self.particle), ("nh", self.hole)):
+            res = self.nextItem(name)
             if self.transform is None:
-                # No need for the transformation, cut the cost:
-                self._einsum_path, _ = np.einsum_path("xtxt->x", data['np'], optimize="optimal")
-                log.info("Optimized Einsum path for time averaging.")
+                np.mean(_propagatorDiagonal(allToAll, stage, itr), axis=1, out=res)
+                np.subtract(1, res, out=res)
             else:
-                # We'll time average and transform at once:
-                self._einsum_path, _ = np.einsum_path("ax,xtxt->a", self.transform, data["np"], optimize="optimal")
-                log.info("Optimized Einsum path for time averaging and unitary transformation.")
-
-        if self.transform is None:
-            for name, correlator in data.items():
-                res = self.nextItem(name)
-                np.einsum("xtxt->x", correlator,
-                          optimize=self._einsum_path, out=res)
-                res /= nt
-        else:
-            for name, correlator in data.items():
-                res = self.nextItem(name)
-                np.einsum("ax,xtxt->a", self.transform, correlator,
-                          optimize=self._einsum_path, out=res)
-                res /= nt
+                density = 1 - _propagatorDiagonal(allToAll, stage, itr).mean(axis=1)
+                np.matmul(self.transform, density, out=res)
 
     def setup(self, memoryAllowance, expectedNConfigs, file, maxBufferSize=None):
         res = super().setup(memoryAllowance, expectedNConfigs, file, maxBufferSize)
@@ -154,12 +133,14 @@ class OnePointFunctions(Measurement):
         """
 
         nx = next(iter(measurements.values())).shape[1]
-        U = commonTransform if commonTransform is not None else np.eye((nx, nx))
+        U = commonTransform if commonTransform is not None else np.eye(nx)
 
         derived = dict()
 
-        derived["rho"] = measurements["np"] - measurements["nh"]
-        derived["n"]   = measurements["np"] + measurements["nh"]
-        derived["S3"]  = 0.5 * (np.expand_dims(np.sum(U, axis=1), axis=0) - derived["n"])
+        derived["rho"] = np.subtract(measurements["np"], measurements["nh"])
+        derived["n"]   = np.add(measurements["np"], measurements["nh"])
+        # Scale in place to avoid another temporary of shape (nMeas, nx).
+        derived["S3"]  = np.subtract(np.sum(U, axis=1), derived["n"])
+        derived["S3"] *= 0.5
 
         return derived
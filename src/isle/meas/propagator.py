@@ -63,6 +63,15 @@ class AllToAll:
         propagator = np.transpose(propagator, axes=[1,0,3,2])
         return propagator
 
+    def diagonal(self, stage, itr):
+        r"""!
+        Extract the spacetime diagonal of the all-to-all propagator.
+        Re-uses the cached result of `__call__` if possible.
+        \returns (Minverse)_{xtxt}, a 2D tensor with space and time indices.
+                 This is a copy, modifying it does not affect the cached propagator.
+        """
+        return np.einsum("xtxt->xt", self(stage, itr)).copy()
+
     def save(self, base, name):
         r"""!
         \param base HDF5 group in which to store data.
@@ -22,5 +22,6 @@ class TotalPhi(Measurement):
 
     def __call__(self, stage, itr):
         """!Record the total phi and mean value of phi^2."""
-        self.nextItem("Phi")[...] = np.sum(stage.phi)
-        self.nextItem("phiSquared")[...] = np.linalg.norm(stage.phi)**2 / len(stage.phi)
+        phi = np.array(stage.phi, copy=False)
+        self.nextItem("Phi")[...] = phi.sum()
+        self.nextItem("phiSquared")[...] = np.vdot(phi, phi).real / phi.size
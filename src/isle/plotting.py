@@ -28,7 +28,6 @@ import numpy as np
 import h5py as h5
 
 import isle.meas
-from isle.collection import neighbors
 ## \endcond DO_NOT_DOCUMENT
 
 def setupMPL():
@@ -115,7 +114,7 @@ def polarDensity(data, innerRadius, outerRadius, kde,
     \param bins Number of histogram bins or number of KDE samples.
     \param bandwidth *KDE only*. Bandwidth of the kernel.
     \param kernel *KDE only*. The kind of kernel to use. See `sklearn.neighbors.KernelDensity`.
-    \returns Two lists:
+    \returns Two arrays:
              - Angles of the points where the density was estimated. Range: `[-pi, pi]`
              - Radii computed from the density.
     """
@@ -140,11 +139,10 @@ def polarDensity(data, innerRadius, outerRadius, kde,
             bins = int(np.sqrt(len(data)))
 
         hist, bin_edges = np.histogram(data, bins, (-np.pi, np.pi), density=True)
-        # angle, outer radius pairs
-        points = [((high+low)/2,  # assumes that there are no bins on the -pi, pi boundary
-                   innerRadius + (outerRadius-innerRadius)*val)
-                  for val, (low, high) in zip(hist, neighbors(bin_edges))]
-        xlist, ylist = zip(*points)
+        # angles at bin centers and outer radii
+        # assumes that there are no bins on the -pi, pi boundary
+        xlist = (bin_edges[:-1] + bin_edges[1:]) / 2
+        ylist = innerRadius + (outerRadius-innerRadius)*hist
 
     return xlist, ylist
 
@@ -152,11 +150,10 @@ def runningAverage(data, binsize):
     """!
     Compute an average over the previous `binsize` points for each point in `data[binsize:]`.
     """
-    data = np.array(data)
+    # cumsum[j] = sum(data[:j]) such that each window is a difference of two entries
+    cumsum = np.concatenate(([0], np.cumsum(data, dtype=float)))
     indices = np.arange(binsize, len(data))
-    density = np.empty(len(indices), dtype=float)
-    for i, j in enumerate(indices):
-        density[i] = np.mean(data[j-binsize:j])
+    density = (cumsum[indices] - cumsum[indices-binsize]) / binsize
     return indices, density
 
 def polarHistogram(ax, data, kde=False, bins=None, bandwidth=None, kernel=None,
@@ -240,22 +237,27 @@ def plotTotalPhi(totalPhi, axPhi, axPhiHist):
         placeholder(axPhiHist)
         return
 
+    # convert only once and use views of real and imaginary parts from here on
+    totalPhi = np.asarray(totalPhi)
+    realPhi, imagPhi = totalPhi.real, totalPhi.imag
+    nbins = max(len(totalPhi)//100, 10)
+
     # show history
-    axPhi.plot(np.real(totalPhi), label="Re", c="C0", alpha=0.8)
-    axPhi.plot(np.imag(totalPhi), label="Im", c="C1", alpha=0.8)
+    axPhi.plot(realPhi, label="Re", c="C0", alpha=0.8)
+    axPhi.plot(imagPhi, label="Im", c="C1", alpha=0.8)
 
     # show histograms + KDE
-    axPhiHist.hist(np.real(totalPhi), label="totalPhi, real part, histogram",
-                   orientation="horizontal", bins=max(len(totalPhi)//100, 10), density=True,
+    axPhiHist.hist(realPhi, label="totalPhi, real part, histogram",
+                   orientation="horizontal", bins=nbins, density=True,
                    facecolor="C0", alpha=0.7)
-    samplePts, dens = oneDimKDE(np.real(totalPhi), bandwidth=3/5, failureIsError=False)
+    samplePts, dens = oneDimKDE(realPhi, bandwidth=3/5, failureIsError=False)
     if dens is not None:
         axPhiHist.plot(dens, samplePts, color="C0", label="totalPhi, real part, kde")
-    if np.max(np.imag(totalPhi)) > 0:
-        axPhiHist.hist(np.imag(totalPhi), label="totalPhi, imag part, histogram",
-                       orientation="horizontal", bins=max(len(totalPhi)//100, 10),
+    if np.max(imagPhi) > 0:
+        axPhiHist.hist(imagPhi, label="totalPhi, imag part, histogram",
+                       orientation="horizontal", bins=nbins,
                        density=True, facecolor="C1", alpha=0.7)
-        samplePts, dens = oneDimKDE(np.imag(totalPhi), bandwidth=3/5, failureIsError=False)
+        samplePts, dens = oneDimKDE(imagPhi, bandwidth=3/5, failureIsError=False)
         if dens is not None:
             axPhiHist.plot(dens, samplePts, color="C1", label="totalPhi, imag part, kde")
 
@@ -5,6 +5,7 @@ Unittest for Lattice.
 
 import unittest
 import yaml
+import numpy as np
 
 import isle
 from . import core
@@ -75,3 +76,25 @@ class TestLattice(unittest.TestCase):
         # test ill-labeled
         lat = yaml.safe_load(ILL_LABELED_LATTICE)
         self.assertEqual(isle.isBipartite(lat), False)
+
+    def test_2_builtinLatticeCopies(self):
+        "Test that built in lattices are handed out as independent copies."
+
+        lat = isle.LATTICES["c20"]
+        originalNt = lat.nt()
+        lat.nt(8)
+
+        other = isle.LATTICES["c20"]
+        self.assertIsNot(lat, other)
+        self.assertEqual(other.nt(), originalNt)
+        self.assertEqual(lat.nt(), 8)
+
+        again = isle.LATTICES["c20"]
+        self.assertIsNot(other, again)
+        self.assertEqual(again.name, other.name)
+        self.assertEqual(again.nx(), other.nx())
+        self.assertTrue(core.isEqual(np.array(isle.Matrix(again.hopping())),
+                                     np.array(isle.Matrix(other.hopping()))))
+        for i in range(again.nx()):
+            for j in range(again.nx()):
+                self.assertEqual(again.areNeighbors(i, j), other.areNeighbors(i, j))
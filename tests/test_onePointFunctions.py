@@ -0,0 +1,168 @@
+"""
+Unittest for OnePointFunctions measurement.
+"""
+
+import unittest
+from logging import getLogger
+
+import numpy as np
+
+import isle
+import isle.meas
+from . import core, rand
+
+
+# RNG params
+SEED = 4729
+RAND_MEAN = 0
+RAND_STD = 0.2
+N_REP = 10 # number of repetitions
+
+# (nx, nt) pairs to test
+SHAPES = [(1, 4), (3, 5), (7, 2), (12, 8)]
+
+
+def _randomComplex(shape):
+    "Return a normally distributed random complex array of given shape."
+    return np.random.normal(RAND_MEAN, RAND_STD, shape) \
+        + 1j*np.random.normal(RAND_MEAN, RAND_STD, shape)
+
+
+class _HFMStub:
+    "Provides the only part of a HubbardFermiMatrix used by OnePointFunctions."
+    def __init__(self, nx):
+        self._nx = nx
+
+    def nx(self):
+        return self._nx
+
+class _CallOnlyAllToAllStub:
+    "Stand-in for an all-to-all propagator without a diagonal method."
+    def __init__(self, propagator):
+        self.hfm = _HFMStub(propagator.shape[0])
+        self.nx = propagator.shape[0]
+        self.propagator = propagator
+
+    def __call__(self, stage, itr):
+        return self.propagator
+
+class _AllToAllStub(_CallOnlyAllToAllStub):
+    "Stand-in for meas.AllToAll which returns a fixed propagator."
+    def diagonal(self, stage, itr):
+        return np.einsum("xtxt->xt", self(stage, itr)).copy()
+
+
+def _makeMeasurement(P, H, transform, stubType=_AllToAllStub):
+    """
+    Construct a OnePointFunctions measurement with stubbed propagators
+    whose result buffers are plain arrays returned by the second element.
+    """
+    meas = isle.meas.OnePointFunctions(stubType(P), stubType(H),
+                                       "onePoint", transform=transform)
+    results = {name: np.empty(P.shape[0], dtype=complex)
+               for name in isle.meas.OnePointFunctions.CORRELATOR_NAMES}
+    # bypass the file-backed buffers set up in Measurement.setup
+    meas.nextItem = lambda name: results[name]
+    return meas, results
+
+def _kroneckerReference(propagator, transform):
+    "Time averaged one-point function from the full Kronecker delta formula."
+    nx, nt = propagator.shape[:2]
+    d = np.eye(nx*nt).reshape(*propagator.shape)
+    if transform is None:
+        return np.einsum("xtxt->x", d-propagator) / nt
+    return np.einsum("ax,xtxt->a", transform, d-propagator) / nt
+
+
+class TestOnePointFunctions(unittest.TestCase):
+    def _checkCall(self, transform, nx, nt, rep, stubType=_AllToAllStub):
+        P = _randomComplex((nx, nt, nx, nt))
+        H = _randomComplex((nx, nt, nx, nt))
+        meas, results = _makeMeasurement(P, H, transform, stubType)
+        meas(None, 0)
+
+        for name, propagator in (("np", P), ("nh", H)):
+            expected = _kroneckerReference(propagator, transform)
+            self.assertTrue(core.isEqual(results[name], expected, nOps=nx*nt, prec=1e-13),
+                            msg=f"Failed check of {name} in repetition {rep}\n"
+                            f"with nx = {nx}, nt = {nt}, transform = {transform}\n"
+                            f"result = {results[name]}, expected = {expected}")
+
+    def test_1_call(self):
+        "Test OnePointFunctions.__call__ without a transformation."
+        for rep in range(N_REP):
+            for nx, nt in SHAPES:
+                self._checkCall(None, nx, nt, rep)
+
+    def test_2_callTransform(self):
+        "Test OnePointFunctions.__call__ with a transformation."
+        for rep in range(N_REP):
+            for nx, nt in SHAPES:
+                self._checkCall(_randomComplex((nx, nx)), nx, nt, rep)
+
+    def _checkDerived(self, transform, nmeas, nx, rep):
+        measurements = {"np": _randomComplex((nmeas, nx)),
+                        "nh": _randomComplex((nmeas, nx))}
+        derived = isle.meas.OnePointFunctions.computeDerivedCorrelators(measurements, transform)
+
+        U = np.eye(nx) if transform is None else transform
+        n = measurements["np"] + measurements["nh"]
+        expected = {"rho": measurements["np"] - measurements["nh"],
+                    "n": n,
+                    "S3": 0.5*(U.sum(1) - n)}
+        for name, corr in expected.items():
+            self.assertEqual(derived[name].shape, (nmeas, nx))
+            self.assertTrue(core.isEqual(derived[name], corr),
+                            msg=f"Failed check of derived correlator {name} in repetition {rep}\n"
+                            f"with nmeas = {nmeas}, nx = {nx}, transform = {transform}")
+
+    def test_3_computeDerivedCorrelators(self):
+        "Test OnePointFunctions.computeDerivedCorrelators without a transformation."
+        for rep in range(N_REP):
+            for nx, nmeas in SHAPES:
+                self._checkDerived(None, nmeas, nx, rep)
+
+    def test_4_computeDerivedCorrelatorsTransform(self):
+        "Test OnePointFunctions.computeDerivedCorrelators with a transformation."
+        for rep in range(N_REP):
+            for nx, nmeas in SHAPES:
+                self._checkDerived(_randomComplex((nx, nx)), nmeas, nx, rep)
+
+    def test_5_callWithoutDiagonal(self):
+        "Test OnePointFunctions.__call__ with propagators that have no diagonal method."
+        for rep in range(N_REP):
+            for nx, nt in SHAPES:
+                self._checkCall(None, nx, nt, rep, _CallOnlyAllToAllStub)
+                self._checkCall(_randomComplex((nx, nx)), nx, nt, rep, _CallOnlyAllToAllStub)
+
+    def test_6_allToAllDiagonal(self):
+        "Test that AllToAll.diagonal matches the full propagator and does not alias its cache."
+        lattice = isle.LATTICES["four_sites"]
+        nx = lattice.nx()
+        for nt in (2, 4):
+            hfm = isle.HubbardFermiMatrixDia(lattice.hopping()/nt, 0, -1)
+            allToAll = isle.meas.AllToAll(hfm, isle.Species.PARTICLE)
+            stage = isle.evolver.EvolutionStage(isle.Vector(_randomComplex(nx*nt)), 0j)
+
+            diag = allToAll.diagonal(stage, 0)
+            expected = np.einsum("xtxt->xt", allToAll(stage, 0)).copy()
+            self.assertEqual(diag.shape, (nx, nt))
+            self.assertTrue(core.isEqual(diag, expected),
+                            msg=f"Failed check of AllToAll.diagonal with nt = {nt}")
+
+            diag[...] = 0
+            self.assertTrue(core.isEqual(np.einsum("xtxt->xt", allToAll(stage, 0)), expected),
+                            msg=f"Modifying AllToAll.diagonal changed the cached propagator with nt = {nt}")
+
+
+
+def setUpModule():
+    "Setup the OnePointFunctions test module."
+
+    logger = getLogger(__name__)
+    logger.info("""Parameters for RNG:
+    seed: {}
+    mean: {}
+    std:  {}""".format(SEED, RAND_MEAN, RAND_STD))
+
+    rand.setup(SEED)
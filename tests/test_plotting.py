@@ -0,0 +1,90 @@
+"""
+Unittest for helpers in the plotting module.
+"""
+
+import unittest
+from logging import getLogger
+
+import numpy as np
+
+import isle
+from . import core, rand
+
+try:
+    import isle.plotting
+    _HAVE_PLOTTING = True
+except ImportError:
+    _HAVE_PLOTTING = False
+
+
+# RNG params
+SEED = 2307
+RAND_MEAN = 0
+RAND_STD = 1
+N_REP = 20 # number of repetitions
+MAX_LEN = 200
+
+
+def _loopRunningAverage(data, binsize):
+    "Reference implementation averaging one window at a time."
+    data = np.array(data)
+    indices = np.arange(binsize, len(data))
+    density = np.empty(len(indices), dtype=float)
+    for i, j in enumerate(indices):
+        density[i] = np.mean(data[j-binsize:j])
+    return indices, density
+
+
+@unittest.skipUnless(_HAVE_PLOTTING, "plotting requires matplotlib")
+class TestPlotting(unittest.TestCase):
+    def _checkRunningAverage(self, data, binsize, rep):
+        indices, density = isle.plotting.runningAverage(data, binsize)
+        expectedIndices, expectedDensity = _loopRunningAverage(data, binsize)
+
+        self.assertTrue(np.array_equal(indices, expectedIndices),
+                        msg=f"Failed check of indices in repetition {rep}\n"
+                        f"with len(data) = {len(data)}, binsize = {binsize}")
+        self.assertEqual(density.dtype, float)
+        self.assertTrue(core.isEqual(density, expectedDensity, nOps=len(data), prec=1e-14),
+                        msg=f"Failed check of density in repetition {rep}\n"
+                        f"with len(data) = {len(data)}, binsize = {binsize}\n"
+                        f"density = {density}, expected = {expectedDensity}")
+
+    def test_1_runningAverage(self):
+        "Test runningAverage on float data."
+        for rep in range(N_REP):
+            n = np.random.randint(1, MAX_LEN)
+            data = np.random.normal(RAND_MEAN, RAND_STD, n)
+            self._checkRunningAverage(data, np.random.randint(1, n+1), rep)
+
+    def test_2_runningAverageInt(self):
+        "Test runningAverage on integer data, e.g. trajectory points."
+        for rep in range(N_REP):
+            n = np.random.randint(1, MAX_LEN)
+            data = np.random.randint(0, 2, n)
+            self._checkRunningAverage(data, np.random.randint(1, n+1), rep)
+
+    def test_3_runningAverageLargeBin(self):
+        "Test runningAverage with bins at least as large as the data."
+        for rep in range(N_REP):
+            n = np.random.randint(0, MAX_LEN)
+            data = np.random.normal(RAND_MEAN, RAND_STD, n)
+            for binsize in (n, n+1, n+np.random.randint(2, MAX_LEN)):
+                if binsize == 0:
+                    continue
+                indices, density = isle.plotting.runningAverage(data, binsize)
+                self.assertEqual(len(indices), 0)
+                self.assertEqual(len(density), 0)
+                self._checkRunningAverage(data, binsize, rep)
+
+
+def setUpModule():
+    "Setup the plotting test module."
+
+    logger = getLogger(__name__)
+    logger.info("""Parameters for RNG:
+    seed: {}
+    mean: {}
+    std:  {}""".format(SEED, RAND_MEAN, RAND_STD))
+
+    rand.setup(SEED)